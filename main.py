@@ -1,190 +1,268 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import socket
+import time
 from datetime import datetime, UTC
 from typing import List
-from uuid import uuid4
+from uuid import UUID, uuid4
 
-from fastapi import FastAPI
-from starlette.responses import JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from starlette.responses import JSONResponse, Response
 
 from models.address import AddressBase, AddressRead, AddressCreate, AddressUpdate
 from models.customer import CustomerRead, CustomerCreate, CustomerUpdate
 from models.health import Health
+from models.openapi_examples import request_example, response_example
+from utils.ids import uuid4_batch
+from utils.responses import (
+    JSON_MEDIA_TYPE, VARY_ACCEPT, NegotiatedJSONResponse, negotiated_encoder,
+)
 
 port = int(os.environ.get("FASTAPIPORT", 8000))
 
+def _now() -> datetime:
+    return datetime.now(UTC)
+
+def _merge_update(existing: BaseModel, update: BaseModel, **server_fields):
+    """
+    Apply a PATCH payload to a record and validate the result. The payload is client
+    input (e.g. an explicit null for a required field), so unlike the server-built
+    records it must not bypass validation; failures are reported as a 422.
+    """
+    data = dict(existing)
+    data.update({name: getattr(update, name) for name in update.model_fields_set})
+    data.update(server_fields)
+    try:
+        return type(existing).model_validate(data)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        )
+
+# Built once so list responses are serialized in a single pydantic-core call
+_ADDRESS_LIST_ADAPTER = TypeAdapter(List[AddressRead])
+
 app = FastAPI(
     title="Customer API",
     description="Service for managing customer data",
     version="0.0.1",
+    default_response_class=ORJSONResponse,
+)
+
+# Compress larger bodies (address lists); small ones such as /health stay below
+# minimum_size and are sent uncompressed so probes pay no gzip cost
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# -----------------------------------------------------------------------------
+# Dummy records
+# -----------------------------------------------------------------------------
+# Built once at import; handlers model_copy() them with fresh IDs and timestamps.
+# IDs and timestamps here are placeholders that every copy overwrites.
+_EPOCH = datetime.fromtimestamp(0, UTC)
+
+_ADDRESS_TEMPLATES = [
+    AddressRead.model_construct(
+        address_id=UUID(int=0),
+        street="123 Broadway Ave",
+        city="New York",
+        state="NY",
+        postal_code="10027",
+        country="USA",
+        created_at=_EPOCH,
+        updated_at=_EPOCH,
+    ),
+    AddressRead.model_construct(
+        address_id=UUID(int=0),
+        street="456 Elm Street",
+        city="Boston",
+        state="MA",
+        postal_code="02118",
+        country="USA",
+        created_at=_EPOCH,
+        updated_at=_EPOCH,
+    ),
+]
+
+_CUSTOMER_TEMPLATE = CustomerRead.model_construct(
+    customer_id=UUID(int=0),
+    first_name="Rahul",
+    middle_name="K.",
+    last_name="Singh",
+    university_id="UNI0001",
+    email="rahul.singh@columbia.edu",
+    phone="+1-555-123-4567",
+    birth_date=datetime(1995, 5, 20).date(),
+    status="active",
+    address=[
+        AddressBase.model_construct(
+            street="123 Broadway Ave",
+            city="New York",
+            state="NY",
+            postal_code="10027",
+            country="USA",
+        )
+    ],
+    created_at=_EPOCH,
+    updated_at=_EPOCH,
 )
 
 # -----------------------------------------------------------------------------
 # Customer Management endpoints
 # -----------------------------------------------------------------------------
 
+def _resolve_host_ip() -> str:
+    try:
+        return socket.gethostbyname(socket.gethostname())
+    except OSError:
+        return "127.0.0.1"
+
+# The host IP does not change for the lifetime of the process, so resolve it once
+_HOST_IP = _resolve_host_ip()
+_HEALTH_FIELDS = {"status": 200, "status_message": "OK", "ip_address": _HOST_IP}
+
 def make_health() -> Health:
-    return Health(
-        status=200,
-        status_message="OK",
-        timestamp=datetime.now(UTC).isoformat() + "Z",
-        ip_address=socket.gethostbyname(socket.gethostname())
+    return Health.model_construct(
+        timestamp=_now().isoformat() + "Z",
+        **_HEALTH_FIELDS
     )
 
+# Probes hit /health constantly; reuse the serialized body for a short window
+_HEALTH_TTL_SECONDS = 1.0
+_health_cache: tuple[float, bytes] = (float("-inf"), b"")
+
 @app.get("/health", response_model=Health)
-def get_health():
-    return make_health()
+async def get_health():
+    global _health_cache
+    cached_at, body = _health_cache
+    tick = time.monotonic()
+    if tick - cached_at >= _HEALTH_TTL_SECONDS:
+        body = orjson.dumps(make_health().model_dump())
+        _health_cache = (tick, body)
+    return Response(content=body, media_type="application/json")
 
-@app.post("/customers", response_model=CustomerRead, status_code=201)
-def create_customer(customer: CustomerCreate):
+@app.post("/customers", response_model=CustomerRead, status_code=201,
+          responses=response_example("CustomerRead", 201),
+          openapi_extra=request_example("CustomerCreate"))
+async def create_customer(customer: CustomerCreate, encoder=Depends(negotiated_encoder)):
     """
     Dummy implementation: returns a CustomerRead object without saving to a real database.
     """
-    return CustomerRead(
+    now = _now()
+    # Inbound payload is already validated; skip re-validation on the way out
+    created = CustomerRead.model_construct(
         customer_id=uuid4(),
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-        **customer.model_dump()
+        created_at=now,
+        updated_at=now,
+        **dict(customer)
     )
+    return encoder(created.model_dump(mode="json"), status_code=201)
 
-@app.get("/customers/{customer_id}", response_model=CustomerRead)
-def get_customer_by_id(customer_id: str):
-    return CustomerRead(
-        customer_id=uuid4(),
-        first_name="Rahul",
-        middle_name="K.",
-        last_name="Singh",
-        university_id="UNI0001",
-        email="rahul.singh@columbia.edu",
-        phone="+1-555-123-4567",
-        birth_date=datetime(1995, 5, 20).date(),
-        status="active",
-        address=[
-            AddressBase(
-                street="123 Broadway Ave",
-                city="New York",
-                state="NY",
-                postal_code="10027",
-                country="USA",
-            )
-        ],
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
+@app.get("/customers/{customer_id}", response_model=CustomerRead,
+         responses=response_example("CustomerRead"))
+async def get_customer_by_id(customer_id: str, encoder=Depends(negotiated_encoder)):
+    now = _now()
+    customer = _CUSTOMER_TEMPLATE.model_copy(
+        update={"customer_id": uuid4(), "created_at": now, "updated_at": now}
     )
+    return encoder(customer.model_dump(mode="json"))
 
-@app.patch("/customers/{customer_id}", response_model=CustomerRead)
-def update_customer(customer_id: str, update: CustomerUpdate):
-    existing = CustomerRead(
-        customer_id=uuid4(),
-        first_name="Rahul",
-        middle_name="K.",
-        last_name="Singh",
-        university_id="UNI0001",
-        email="rahul.singh@columbia.edu",
-        phone="+1-555-123-4567",
-        birth_date=datetime(1995, 5, 20).date(),
-        status="active",
-        address=[
-            AddressBase(
-                street="123 Broadway Ave",
-                city="New York",
-                state="NY",
-                postal_code="10027",
-                country="USA",
-            )
-        ],
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-    )
+@app.patch("/customers/{customer_id}", response_model=CustomerRead,
+           responses=response_example("CustomerRead"),
+           openapi_extra=request_example("CustomerUpdate"))
+async def update_customer(customer_id: str, update: CustomerUpdate,
+                          encoder=Depends(negotiated_encoder)):
+    now = _now()
 
     # Merge updates into the existing record
-    data = existing.model_dump()
-    data.update(update.model_dump(exclude_unset=True))
-    data["updated_at"] = datetime.now(UTC)
+    updated = _merge_update(
+        _CUSTOMER_TEMPLATE, update, customer_id=uuid4(), created_at=now, updated_at=now
+    )
 
-    return CustomerRead(**data)
+    return encoder(updated.model_dump(mode="json"))
 
 @app.delete("/customers/{customer_id}", status_code=204)
-def delete_customer(customer_id: str):
+async def delete_customer(customer_id: str):
     return JSONResponse(status_code=204, content=None)
 
 # -----------------------------------------------------------------------------
 # Address endpoints
 # -----------------------------------------------------------------------------
-@app.post("/addresses", response_model=AddressRead, status_code=201)
-def create_address(address: AddressCreate):
+@app.post("/addresses", response_model=AddressRead, status_code=201,
+          responses=response_example("AddressRead", 201),
+          openapi_extra=request_example("AddressCreate"))
+async def create_address(address: AddressCreate, encoder=Depends(negotiated_encoder)):
     """
     Dummy implementation: returns an Address with generated ID and timestamps.
     """
-    return AddressRead(
+    now = _now()
+    created = AddressRead.model_construct(
         address_id=uuid4(),
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-        **address.model_dump()
+        created_at=now,
+        updated_at=now,
+        **dict(address)
     )
+    return encoder(created.model_dump(mode="json"), status_code=201)
 
-@app.get("/customers/{customer_id}/addresses", response_model=List[AddressRead])
-def list_customer_addresses(customer_id: str):
+@app.get("/customers/{customer_id}/addresses", response_model=List[AddressRead],
+         responses=response_example("AddressRead", many=True))
+async def list_customer_addresses(customer_id: str, encoder=Depends(negotiated_encoder)):
     """
     Dummy implementation: returns a static list of addresses for the given customer_id.
     """
+    now = _now()
     # Return a dummy list of addresses
-    return [
-        AddressRead(
-            address_id=uuid4(),
-            street="123 Broadway Ave",
-            city="New York",
-            state="NY",
-            postal_code="10027",
-            country="USA",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        ),
-        AddressRead(
-            address_id=uuid4(),
-            street="456 Elm Street",
-            city="Boston",
-            state="MA",
-            postal_code="02118",
-            country="USA",
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        ),
+    addresses = [
+        template.model_copy(update={"address_id": address_id, "created_at": now, "updated_at": now})
+        for template, address_id in zip(_ADDRESS_TEMPLATES, uuid4_batch(len(_ADDRESS_TEMPLATES)))
     ]
+    if encoder is NegotiatedJSONResponse:
+        return Response(
+            _ADDRESS_LIST_ADAPTER.dump_json(addresses), media_type=JSON_MEDIA_TYPE, headers=VARY_ACCEPT
+        )
+    return encoder(_ADDRESS_LIST_ADAPTER.dump_python(addresses, mode="json"))
 
 @app.patch("/customers/{customer_id}/addresses/{address_id}",
-           response_model=AddressRead
+           response_model=AddressRead,
+           responses=response_example("AddressRead"),
+           openapi_extra=request_example("AddressUpdate")
            )
-def update_address(customer_id: str, address_id: str, update: AddressUpdate):
-    existing = AddressRead(
-        address_id=uuid4(),
-        street="123 Broadway Ave",
-        city="New York",
-        state="NY",
-        postal_code="10027",
-        country="USA",
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC),
-    )
+async def update_address(customer_id: str, address_id: str, update: AddressUpdate,
+                         encoder=Depends(negotiated_encoder)):
+    now = _now()
 
-    data = existing.model_dump()
-    data.update(update.model_dump(exclude_unset=True))
-    data["updated_at"] = datetime.now(UTC)
+    updated = _merge_update(
+        _ADDRESS_TEMPLATES[0], update, address_id=uuid4(), created_at=now, updated_at=now
+    )
 
-    return AddressRead(**data)
+    return encoder(updated.model_dump(mode="json"))
 
 @app.delete("/customers/{customer_id}/addresses/{address_id}", status_code=204)
-def delete_address(customer_id: str, address_uni: str):
-    return "Address Deleted", 204
+async def delete_address(customer_id: str, address_id: str):
+    return Response(status_code=204)
 
 # -----------------------------------------------------------------------------
 # Root
 # -----------------------------------------------------------------------------
+_ROOT_BYTES = orjson.dumps(
+    {"message": "Welcome to the Columbia's Second hand store API. See /docs for OpenAPI UI."}
+)
+_ROOT_HEADERS = {
+    "Cache-Control": "public, max-age=3600",
+    "ETag": '"%s"' % hashlib.sha1(_ROOT_BYTES).hexdigest(),
+}
+
 @app.get("/")
-def root():
-    return {"message": "Welcome to the Columbia's Second hand store API. See /docs for OpenAPI UI."}
+async def root(request: Request):
+    if request.headers.get("if-none-match") == _ROOT_HEADERS["ETag"]:
+        return Response(status_code=304, headers=_ROOT_HEADERS)
+    return Response(content=_ROOT_BYTES, media_type="application/json", headers=_ROOT_HEADERS)
 
 # -----------------------------------------------------------------------------
 # Entrypoint for `python main.py`
@@ -192,4 +270,16 @@ def root():
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
+    if os.environ.get("ENV") == "prod":
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=port,
+            workers=os.cpu_count(),
+            # "auto" picks uvloop/httptools when installed (uvloop is unavailable on Windows)
+            loop="auto",
+            http="auto",
+            access_log=False,
+        )
+    else:
+        uvicorn.run("main:app", host="0.0.0.0", port=port, reload=True)
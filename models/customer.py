@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from typing import Optional, List
 from uuid import UUID, uuid4
-from datetime import date, datetime
+from datetime import date, datetime, UTC
+from functools import partial
 from pydantic import BaseModel, Field, StringConstraints
 from typing_extensions import Annotated
 
@@ -17,141 +18,61 @@ class CustomerBase(BaseModel):
     first_name: str = Field(
         ...,
         description="Given name.",
-        json_schema_extra={"example": "Rahul"},
     )
     middle_name: Optional[str] = Field(
         None,
         description="Middle name.",
-        json_schema_extra={"example": "Kumar"},
     )
     last_name: str = Field(
         ...,
         description="Family name.",
-        json_schema_extra={"example": "Singh"},
     )
 
     university_id: Optional[CourseIDType] = Field(
         None,
         description="University ID",
-        json_schema_extra={"example": "UNI1234"},
     )
 
     email: EduEmail = Field(
         ...,
         description="Must be a valid .edu email address.",
-        json_schema_extra={"example": "rahul@columbia.edu"},
     )
     phone: Optional[str] = Field(
         None,
         description="Contact phone number.",
-        json_schema_extra={"example": "+1-646-895-5796"},
     )
 
     address: List[AddressBase] = Field(
         default_factory=list,
         description="List of mailing addresses of the customer.",
-        json_schema_extra={
-            "example": [
-                {
-                    "street": "123 Broadway Ave",
-                    "city": "New York",
-                    "state": "NY",
-                    "postal_code": "10027",
-                    "country": "USA",
-                }
-            ]
-        },
     )
 
     birth_date: Optional[date] = Field(
         None,
         description="Date of birth (YYYY-MM-DD).",
-        json_schema_extra={"example": "2000-07-15"},
     )
 
     status: str = Field(
         default="active",
         description="Customer status (active, inactive, pending).",
-        json_schema_extra={"example": "active"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "first_name": "Rahul",
-                "middle_name": "Kumar",
-                "last_name": "Singh",
-                "university_id": "UNI1234",
-                "email": "rahul@columbia.edu",
-                "phone": "+1-646-895-5796",
-                "birth_date": "2000-07-15",
-                "status": "active",
-                "address": [
-                    {
-                        "street": "123 Broadway Ave",
-                        "city": "New York",
-                        "state": "NY",
-                        "postal_code": "10027",
-                        "country": "USA",
-                    }
-                ],
-            }
-        }
-    }
-
 
 class CustomerCreate(CustomerBase):
     """Creation payload for a Customer."""
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "first_name": "Rahul",
-                    "middle_name": "Kumar",
-                    "last_name": "Singh",
-                    "university_id": "UNI1234",
-                    "email": "rahul@columbia.edu",
-                    "phone": "+1-646-895-5796",
-                    "birth_date": "2000-07-15",
-                    "status": "active",
-                    "address": [
-                        {
-                            "street": "123 Broadway Ave",
-                            "city": "New York",
-                            "state": "NY",
-                            "postal_code": "10027",
-                            "country": "USA",
-                        }
-                    ],
-                }
-            ]
-        }
-    }
 
 
 class CustomerUpdate(BaseModel):
     """Partial update for a Customer; supply only fields to change."""
-    first_name: Optional[str] = Field(None, description="Given name.", json_schema_extra={"example": "Rahul"})
-    middle_name: Optional[str] = Field(None, description="Middle name.", json_schema_extra={"example": "Kumar"})
-    last_name: Optional[str] = Field(None, description="Family name.", json_schema_extra={"example": "Singh"})
-    university_id: Optional[str] = Field(None, description="University ID.", json_schema_extra={"example": "UNI1234"})
-    email: Optional[EduEmail] = Field(None, description=".edu email.", json_schema_extra={"example": "rahul@columbia.edu"})
-    phone: Optional[str] = Field(None, description="Contact phone.", json_schema_extra={"example": "+1-646-895-5796"})
+    first_name: Optional[str] = Field(None, description="Given name.")
+    middle_name: Optional[str] = Field(None, description="Middle name.")
+    last_name: Optional[str] = Field(None, description="Family name.")
+    university_id: Optional[str] = Field(None, description="University ID.")
+    email: Optional[EduEmail] = Field(None, description=".edu email.")
+    phone: Optional[str] = Field(None, description="Contact phone.")
     address: Optional[List[AddressBase]] = Field(None, description="List of mailing addresses.")
-    birth_date: Optional[date] = Field(None, description="DOB (YYYY-MM-DD).", json_schema_extra={"example": "2000-07-15"})
-    status: Optional[str] = Field(None, description="Customer status.", json_schema_extra={"example": "inactive"})
-
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "first_name": "Rahul",
-                "middle_name": "K.",
-                "last_name": "Singh",
-                "email": "rahul@columbia.edu",
-                "status": "inactive"
-            }
-        }
-    }
+    birth_date: Optional[date] = Field(None, description="DOB (YYYY-MM-DD).")
+    status: Optional[str] = Field(None, description="Customer status.")
 
 
 class CustomerRead(CustomerBase):
@@ -159,44 +80,16 @@ class CustomerRead(CustomerBase):
     customer_id: UUID = Field(
         default_factory=uuid4,
         description="System-generated unique Customer ID.",
-        json_schema_extra={"example": "99999999-9999-4999-8999-999999999999"},
     )
     created_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=partial(datetime.now, UTC),
         description="Creation timestamp (UTC).",
-        json_schema_extra={"example": "2025-09-30T10:20:30Z"},
     )
     updated_at: datetime = Field(
-        default_factory=datetime.utcnow,
+        default_factory=partial(datetime.now, UTC),
         description="Last update timestamp (UTC).",
-        json_schema_extra={"example": "2025-09-30T12:00:00Z"},
     )
 
-    model_config = {
-        "json_schema_extra": {
-            "examples": [
-                {
-                    "customer_id": "99999999-9999-4999-8999-999999999999",
-                    "first_name": "Rahul",
-                    "middle_name": "Kumar",
-                    "last_name": "Singh",
-                    "university_id": "UNI0001",
-                    "email": "rahul@columbia.edu",
-                    "phone": "+1-646-895-5796",
-                    "birth_date": "2000-07-15",
-                    "status": "active",
-                    "address": [
-                        {
-                            "street": "123 Broadway Ave",
-                            "city": "New York",
-                            "state": "NY",
-                            "postal_code": "10027",
-                            "country": "USA",
-                        }
-                    ],
-                    "created_at": "2025-09-30T10:20:30Z",
-                    "updated_at": "2025-09-30T12:00:00Z",
-                }
-            ]
-        }
-    }
+    # main.py shares module-level template instances across requests; freezing
+    # guards them against in-place mutation
+    model_config = {"frozen": True}
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+# Example payloads shown in the OpenAPI docs. Kept out of the models themselves so
+# the Pydantic classes carry no per-field example metadata.
+
+_ADDRESS = {
+    "street": "123 Broadway Ave",
+    "city": "New York",
+    "state": "NY",
+    "postal_code": "10027",
+    "country": "USA",
+}
+
+_CUSTOMER = {
+    "first_name": "Rahul",
+    "middle_name": "Kumar",
+    "last_name": "Singh",
+    "university_id": "UNI1234",
+    "email": "rahul@columbia.edu",
+    "phone": "+1-646-895-5796",
+    "birth_date": "2000-07-15",
+    "status": "active",
+    "address": [_ADDRESS],
+}
+
+OPENAPI_EXAMPLES: Dict[str, Any] = {
+    "AddressCreate": _ADDRESS,
+    "AddressUpdate": {
+        "city": "Boston",
+        "state": "MA",
+    },
+    "AddressRead": {
+        "address_id": "99999999-9999-4999-8999-999999999999",
+        **_ADDRESS,
+        "created_at": "2025-09-30T10:20:30Z",
+        "updated_at": "2025-09-30T12:00:00Z",
+    },
+    "CustomerCreate": _CUSTOMER,
+    "CustomerUpdate": {
+        "first_name": "Rahul",
+        "middle_name": "K.",
+        "last_name": "Singh",
+        "email": "rahul@columbia.edu",
+        "status": "inactive",
+    },
+    "CustomerRead": {
+        "customer_id": "99999999-9999-4999-8999-999999999999",
+        **_CUSTOMER,
+        "university_id": "UNI0001",
+        "created_at": "2025-09-30T10:20:30Z",
+        "updated_at": "2025-09-30T12:00:00Z",
+    },
+}
+
+
+def request_example(name: str) -> Dict[str, Any]:
+    """openapi_extra fragment attaching the named example to the JSON request body."""
+    return {"requestBody": {"content": {"application/json": {"example": OPENAPI_EXAMPLES[name]}}}}
+
+
+def response_example(name: str, status_code: int = 200, many: bool = False) -> Dict[int, Any]:
+    """`responses=` entry attaching the named example to a JSON response."""
+    example = OPENAPI_EXAMPLES[name]
+    return {status_code: {"content": {"application/json": {"example": [example] if many else example}}}}
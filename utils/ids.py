@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import os
+from typing import List
+from uuid import UUID
+
+
+def uuid4_batch(n: int) -> List[UUID]:
+    """
+    Return n random (version 4) UUIDs from a single os.urandom call.
+    Equivalent to calling uuid4() n times, minus n - 1 urandom syscalls.
+    """
+    raw = bytearray(os.urandom(16 * n))
+    ids = []
+    for offset in range(0, 16 * n, 16):
+        # Set the version and variant bits per RFC 4122, as uuid4() does
+        raw[offset + 6] = (raw[offset + 6] & 0x0F) | 0x40
+        raw[offset + 8] = (raw[offset + 8] & 0x3F) | 0x80
+        ids.append(UUID(bytes=bytes(raw[offset:offset + 16])))
+    return ids
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from typing import Dict, Mapping, Optional, Type
+
+import msgpack
+from fastapi import Request
+from fastapi.responses import ORJSONResponse
+from starlette.responses import Response
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/x-msgpack"
+
+# The body format depends on Accept, so shared caches must key on it
+VARY_ACCEPT = {"Vary": "Accept"}
+
+
+class _VaryAccept:
+    def __init__(self, content=None, status_code: int = 200,
+                 headers: Optional[Mapping[str, str]] = None, **kwargs):
+        super().__init__(content, status_code, {**VARY_ACCEPT, **(headers or {})}, **kwargs)
+
+
+class NegotiatedJSONResponse(_VaryAccept, ORJSONResponse):
+    """JSON response chosen by content negotiation."""
+
+
+class MsgpackResponse(_VaryAccept, Response):
+    """Response encoded as MessagePack; content must already be JSON-compatible."""
+    media_type = MSGPACK_MEDIA_TYPE
+    render = staticmethod(msgpack.packb)
+
+
+def _parse_accept(header: str) -> Dict[str, float]:
+    """Map each media range in an Accept header to its quality value."""
+    ranges: Dict[str, float] = {}
+    for item in header.split(","):
+        media_range, *params = item.split(";")
+        media_range = media_range.strip().lower()
+        if not media_range:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        ranges[media_range] = max(q, ranges.get(media_range, 0.0))
+    return ranges
+
+
+def _quality(ranges: Dict[str, float], media_type: str) -> float:
+    """Quality of media_type under the most specific matching range."""
+    for candidate in (media_type, media_type.split("/")[0] + "/*", "*/*"):
+        if candidate in ranges:
+            return ranges[candidate]
+    return 0.0
+
+
+async def negotiated_encoder(request: Request) -> Type[Response]:
+    """
+    Dependency picking the response class from the Accept header.
+    JSON stays the default; MessagePack is only used when the client names it
+    explicitly with a non-zero quality at least as high as JSON's.
+    """
+    accept = request.headers.get("accept")
+    if accept:
+        ranges = _parse_accept(accept)
+        msgpack_q = ranges.get(MSGPACK_MEDIA_TYPE, 0.0)
+        if msgpack_q > 0 and msgpack_q >= _quality(ranges, JSON_MEDIA_TYPE):
+            return MsgpackResponse
+    return NegotiatedJSONResponse